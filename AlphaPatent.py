@@ -1,161 +1,682 @@
-import sys
-import json
-
-from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout,
-    QLineEdit, QPushButton, QDialog, QTreeView, QCompleter
-)
-from PyQt5.QtGui import QStandardItemModel, QStandardItem
-from PyQt5.QtCore import Qt, QUrl
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-
-
-class MainWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Patent Search")
-        self.load_data()  # Load our JSON data
-
-        # Create a QLineEdit for the search bar.
-        self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("Search for a patent...")
-        # Center the search bar horizontally.
-        self.search_bar.setMaximumWidth(400)
-
-        # Create an autocomplete completer using the JSON keys.
-        completer = QCompleter(list(self.data.keys()))
-        completer.setCaseSensitivity(Qt.CaseInsensitive)
-        self.search_bar.setCompleter(completer)
-        self.search_bar.returnPressed.connect(self.handle_search)
-
-        # Button to show the tree view.
-        self.view_tree_button = QPushButton("View Tree")
-        self.view_tree_button.clicked.connect(self.show_tree_view)
-
-        # QWebEngineView will be used to display PDF documents.
-        self.pdf_view = QWebEngineView()
-
-        # Layout: search bar and button at top, PDF view below.
-        central_widget = QWidget()
-        layout = QVBoxLayout(central_widget)
-        layout.addWidget(self.search_bar, alignment=Qt.AlignHCenter)
-        layout.addWidget(self.view_tree_button, alignment=Qt.AlignHCenter)
-        layout.addWidget(self.pdf_view)
-
-        self.setCentralWidget(central_widget)
-
-    def load_data(self):
-        """Load and parse the JSON data from data.json."""
-        try:
-            with open("data.json", "r") as f:
-                raw_data = json.load(f)
-        except Exception as e:
-            print("Error loading data.json:", e)
-            raw_data = {}
-
-        # Process the data.
-        # We expect each value to be a string: "description:Topic>Subtopic:PDF_link"
-        self.data = {}
-        for patent, value in raw_data.items():
-            parts = value.split(":", 2)  # at most 3 parts
-            if len(parts) == 3:
-                description, classification, pdf_link = parts
-            else:
-                description = parts[0].strip() if parts else ""
-                classification = ""
-                pdf_link = ""
-            self.data[patent] = {
-                "description": description.strip(),
-                "classification": classification.strip(),  # expected to be "Topic>Subtopic"
-                "pdf_link": pdf_link.strip()
-            }
-
-    def handle_search(self):
-        """When the user presses Enter in the search bar, load the corresponding PDF."""
-        query = self.search_bar.text().strip()
-        if query in self.data:
-            pdf_link = self.data[query]["pdf_link"]
-            if pdf_link:
-                # Load the PDF link in the QWebEngineView.
-                self.pdf_view.load(QUrl(pdf_link))
-            else:
-                print("No PDF link available for", query)
-        else:
-            print("Patent not found:", query)
-
-    def show_tree_view(self):
-        """Show a dialog with a tree view of the patents organized by Topic and Subtopic."""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Patent Tree View")
-        dialog.resize(400, 500)
-
-        tree_view = QTreeView(dialog)
-        model = QStandardItemModel()
-        model.setHorizontalHeaderLabels(["Patent Organization"])
-
-        # Build a nested dictionary: topics → subtopics → list of patents.
-        topics = {}
-        for patent, info in self.data.items():
-            classification = info["classification"]
-            if ">" in classification:
-                topic, subtopic = [s.strip() for s in classification.split(">", 1)]
-            else:
-                topic = classification.strip() or "Uncategorized"
-                subtopic = ""
-            topics.setdefault(topic, {})
-            if subtopic:
-                topics[topic].setdefault(subtopic, []).append(patent)
-            else:
-                topics[topic].setdefault("", []).append(patent)
-
-        # Populate the QStandardItemModel with the tree data.
-        for topic, subtopics in topics.items():
-            topic_item = QStandardItem(topic)
-            for subtopic, patents in subtopics.items():
-                if subtopic:
-                    subtopic_item = QStandardItem(subtopic)
-                    for patent in patents:
-                        patent_item = QStandardItem(patent)
-                        subtopic_item.appendRow(patent_item)
-                    topic_item.appendRow(subtopic_item)
-                else:
-                    # If no subtopic is provided, add the patent directly under the topic.
-                    for patent in patents:
-                        patent_item = QStandardItem(patent)
-                        topic_item.appendRow(patent_item)
-            model.appendRow(topic_item)
-
-        tree_view.setModel(model)
-        tree_view.expandAll()
-
-        # Optional: double-clicking a patent (leaf node) loads its PDF.
-        tree_view.doubleClicked.connect(lambda index: self.tree_item_double_clicked(index, model))
-
-        dlg_layout = QVBoxLayout(dialog)
-        dlg_layout.addWidget(tree_view)
-        dialog.setLayout(dlg_layout)
-
-        dialog.exec_()
-
-    def tree_item_double_clicked(self, index, model):
-        """If a leaf item (patent) is double-clicked in the tree, load its PDF."""
-        item = model.itemFromIndex(index)
-        if item and not item.hasChildren():  # leaf item assumed to be a patent
-            patent = item.text()
-            if patent in self.data:
-                pdf_link = self.data[patent]["pdf_link"]
-                if pdf_link:
-                    self.pdf_view.load(QUrl(pdf_link))
-                    self.search_bar.setText(patent)
-                else:
-                    print("No PDF link for", patent)
-            else:
-                print("Patent not found:", patent)
-
-
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = MainWindow()
-    window.resize(800, 600)
-    window.show()
-    sys.exit(app.exec_())
+import os
+import re
+import sys
+import json
+import bisect
+import threading
+import pickle
+import hashlib
+import functools
+import itertools
+import urllib.parse
+
+import numpy as np
+import requests
+
+from PyQt5.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel,
+    QLineEdit, QPushButton, QDialog, QTreeView, QCompleter
+)
+from PyQt5.QtGui import QStandardItemModel, QStandardItem
+from PyQt5.QtCore import Qt, QUrl, QTimer, QAbstractListModel, pyqtSignal
+from PyQt5.QtWebEngineWidgets import QWebEngineView
+
+import networkx as nx
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+
+# ForceAtlas2 runs its Barnes-Hut force loop in Cython, so it is far faster
+# than networkx's pure-Python spring_layout on large graphs. igraph's
+# layout_fr is a C implementation and a good second choice; spring_layout is
+# only the last resort.
+try:
+    from fa2_modified import ForceAtlas2
+except ImportError:
+    ForceAtlas2 = None
+
+try:
+    import igraph
+except ImportError:
+    igraph = None
+
+try:
+    import pygtrie
+except ImportError:
+    pygtrie = None
+
+try:
+    import mplcursors
+except ImportError:
+    mplcursors = None
+
+# pyqtgraph renders through QGraphicsScene (optionally OpenGL) and does its
+# own scatter hit-testing in C++, so it is the preferred mind-map backend;
+# the matplotlib canvas remains the fallback.
+try:
+    import pyqtgraph as pg
+except ImportError:
+    pg = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+# orjson is a Rust JSON parser, roughly 5× faster than the stdlib on large
+# documents; it returns plain dicts/strs so nothing downstream changes.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Sidecar cache of the fully post-processed data dict. Bump the version
+# whenever the shape of self.data changes so stale caches are ignored.
+_PICKLE_CACHE = "data.json.pkl"
+_PICKLE_CACHE_VERSION = 2  # v2: added the pre-split "topic_subtopic" tuple
+
+# Directory of memoized mind-map layouts, keyed by a hash of the edge list.
+_LAYOUT_CACHE_DIR = ".layout_cache"
+
+# We only ever want the og:url meta tag out of a search result page, so a
+# compiled regex over the raw bytes beats building a whole DOM for it.
+_OG_URL_RE = re.compile(
+    rb'<meta[^>]*property=["\']og:url["\'][^>]*content=["\']([^"\']+)', re.I)
+
+# One pooled session for all patent searches: HTTP keep-alive reuses the
+# TCP+TLS connection, so only the first query pays the handshake.
+_session = requests.Session()
+_session.headers.update({"User-Agent": "Mozilla/5.0"})
+
+
+def _google_search_url(query):
+    return "https://patents.google.com/?q=" + urllib.parse.quote_plus(query)
+
+
+@functools.lru_cache(maxsize=512)
+def _search_patents_cached(query):
+    """Resolve a free-text query to a Google Patents URL (memoized).
+
+    Raises requests.RequestException on network trouble — lru_cache does
+    not memoize raising calls, so transient failures stay retryable.
+    """
+    search_url = _google_search_url(query)
+    response = _session.get(search_url, timeout=5)
+    response.raise_for_status()
+    m = _OG_URL_RE.search(response.content)
+    return m.group(1).decode() if m else search_url
+
+
+class GooglePatentSearcher:
+    """Look up patents on Google Patents, reusing connections and results."""
+
+    @staticmethod
+    def search_patents(query):
+        try:
+            return _search_patents_cached(query)
+        except requests.RequestException as e:
+            print("Patent search failed:", e)
+            return _google_search_url(query)
+
+
+class _PrefixCompletionModel(QAbstractListModel):
+    """Base for completion models that filter their keys by prefix.
+
+    Qt's default completer rescans its whole list on every keystroke
+    (O(N) per keypress); subclasses implement _match(prefix) with a
+    lookup structure that avoids the scan.
+    """
+
+    MAX_RESULTS = 50
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._matches = []
+
+    def setPrefix(self, prefix):
+        self.beginResetModel()
+        self._matches = self._match(prefix.lower())
+        self.endResetModel()
+
+    def rowCount(self, parent=None):
+        return len(self._matches)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self._matches[index.row()]
+        return None
+
+
+class TrieCompletionModel(_PrefixCompletionModel):
+    """Completion via a prefix trie: O(length of the prefix) per keystroke."""
+
+    def __init__(self, keys, parent=None):
+        super().__init__(parent)
+        self._trie = pygtrie.CharTrie()
+        for key in keys:
+            self._trie[key.lower()] = key
+
+    def _match(self, prefix):
+        try:
+            values = self._trie.itervalues(prefix=prefix)
+            return list(itertools.islice(values, self.MAX_RESULTS))
+        except KeyError:  # no key starts with this prefix
+            return []
+
+
+class BisectCompletionModel(_PrefixCompletionModel):
+    """Completion via bisect over a sorted key list: O(log N) per keystroke.
+
+    Used when pygtrie is unavailable; '\\uffff' bounds the prefix range.
+    """
+
+    def __init__(self, keys, parent=None):
+        super().__init__(parent)
+        pairs = sorted((key.lower(), key) for key in keys)
+        self._keys_lower = [lowered for lowered, _ in pairs]
+        self._keys = [key for _, key in pairs]
+
+    def _match(self, prefix):
+        lo = bisect.bisect_left(self._keys_lower, prefix)
+        hi = bisect.bisect_left(self._keys_lower, prefix + '\uffff', lo)
+        return self._keys[lo:min(hi, lo + self.MAX_RESULTS)]
+
+
+def compute_layout(G, iterations=50):
+    """Compute 2D positions for G, preferring the compiled layout engines.
+
+    Returns a dict mapping node name -> (x, y), normalized to roughly the
+    unit box so click thresholds behave the same whichever engine ran.
+    """
+    if ForceAtlas2 is not None:
+        # verbose=False: fa2_modified otherwise prints a progress bar and
+        # per-stage timings on every layout run.
+        pos = ForceAtlas2(barnesHutOptimize=True, verbose=False).forceatlas2_networkx_layout(
+            G, pos=None, iterations=iterations)
+    elif igraph is not None:
+        nodes = list(G.nodes())
+        ig = igraph.Graph()
+        ig.add_vertices(nodes)
+        ig.add_edges(list(G.edges()))
+        layout = ig.layout_fruchterman_reingold(niter=iterations)
+        pos = {name: tuple(coord) for name, coord in zip(nodes, layout.coords)}
+    else:
+        return nx.spring_layout(G, k=0.5, iterations=iterations)
+
+    # Rescale to [-1, 1] on the dominant axis (spring_layout's convention).
+    scale = max(max(abs(x), abs(y)) for x, y in pos.values()) or 1.0
+    return {name: (x / scale, y / scale) for name, (x, y) in pos.items()}
+
+
+class MainWindow(QMainWindow):
+    # Emitted from the search worker thread; the queued connection hops
+    # the resolved URL back onto the GUI thread.
+    _search_resolved = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Patent Search")
+        self._layout_cache = {}  # graph hash -> positions dict
+        self._data_version = 0  # bumped whenever self.data is (re)built
+        self._tree_model = None
+        self._tree_model_version = -1
+        self.load_data()  # Load our JSON data
+
+        # Create a QLineEdit for the search bar.
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText("Search for a patent...")
+        # Center the search bar horizontally.
+        self.search_bar.setMaximumWidth(400)
+
+        # Create an autocomplete completer using the JSON keys. Both models
+        # filter by prefix themselves (trie walk, or bisect over a sorted
+        # list when pygtrie is missing), so the completer runs in unfiltered
+        # mode and just shows whatever the model holds.
+        completer = QCompleter(self)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        if pygtrie is not None:
+            self._completion_model = TrieCompletionModel(self.data.keys(), self)
+        else:
+            self._completion_model = BisectCompletionModel(self.data.keys(), self)
+        completer.setModel(self._completion_model)
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.search_bar.textEdited.connect(self._completion_model.setPrefix)
+        self.search_bar.setCompleter(completer)
+        self.search_bar.returnPressed.connect(self.handle_search)
+
+        # Button to show the tree view.
+        self.view_tree_button = QPushButton("View Tree")
+        self.view_tree_button.clicked.connect(self.show_tree_view)
+
+        # Button to show the mind map.
+        self.view_mind_map_button = QPushButton("View Mind Map")
+        self.view_mind_map_button.clicked.connect(self.show_mind_map)
+
+        # A QWebEngineView will display PDF documents, but constructing one
+        # forks a Chromium renderer process (~hundreds of ms and tens of MB
+        # of RSS), so defer it until a PDF is actually loaded and show a
+        # plain placeholder until then.
+        self.pdf_view = None
+        self._pdf_placeholder = QLabel("Search for a patent to view its PDF.")
+        self._pdf_placeholder.setAlignment(Qt.AlignCenter)
+
+        # Debounce PDF loads: rapid-fire searches (mashing Enter, walking
+        # the completer) replace the pending URL instead of queueing a
+        # WebEngine load for each one.
+        self._pending_url = None
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(120)
+        self._load_timer.timeout.connect(self._do_load)
+        self._search_resolved.connect(self._on_search_resolved)
+
+        # Layout: search bar and button at top, PDF view below.
+        central_widget = QWidget()
+        layout = QVBoxLayout(central_widget)
+        layout.addWidget(self.search_bar, alignment=Qt.AlignHCenter)
+        layout.addWidget(self.view_tree_button, alignment=Qt.AlignHCenter)
+        layout.addWidget(self.view_mind_map_button, alignment=Qt.AlignHCenter)
+        layout.addWidget(self._pdf_placeholder)
+        self._central_layout = layout
+
+        self.setCentralWidget(central_widget)
+
+    def load_data(self):
+        """Load and parse the JSON data from data.json."""
+        try:
+            src_mtime = os.path.getmtime("data.json")
+        except OSError:
+            src_mtime = None
+
+        # Fast path: reuse the pickle sidecar from a previous launch if
+        # data.json has not changed since it was written. pickle.load is a
+        # C-level unmarshal and skips both the JSON parse and the
+        # post-processing loop below.
+        if (src_mtime is not None and os.path.exists(_PICKLE_CACHE)
+                and os.path.getmtime(_PICKLE_CACHE) >= src_mtime):
+            try:
+                with open(_PICKLE_CACHE, "rb") as f:
+                    version, data = pickle.load(f)
+                if version == _PICKLE_CACHE_VERSION:
+                    self.data = data
+                    self._build_graph()
+                    return
+            except Exception as e:
+                print("Ignoring unreadable cache", _PICKLE_CACHE + ":", e)
+
+        try:
+            with open("data.json", "rb") as f:
+                raw = f.read()
+            raw_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except Exception as e:
+            print("Error loading data.json:", e)
+            raw_data = {}
+
+        # Process the data.
+        # We expect each value to be a string: "description:Topic>Subtopic:PDF_link"
+        self.data = {}
+        for patent, value in raw_data.items():
+            parts = value.split(":", 2)  # at most 3 parts
+            if len(parts) == 3:
+                description, classification, pdf_link = parts
+            else:
+                description = parts[0].strip() if parts else ""
+                classification = ""
+                pdf_link = ""
+            # Split "Topic>Subtopic" once here so the graph and tree builds
+            # don't redo it per patent on every dialog open. Intern the
+            # pieces: topics/subtopics repeat across thousands of patents,
+            # so identical strings share storage and dict lookups on them
+            # hit the pointer-equality fast path.
+            classification = sys.intern(classification.strip())
+            if ">" in classification:
+                topic, subtopic = [sys.intern(x.strip())
+                                   for x in classification.split(">", 1)]
+            else:
+                topic, subtopic = sys.intern(classification or "Uncategorized"), None
+            self.data[patent] = {
+                "description": description.strip(),
+                "classification": classification,  # expected to be "Topic>Subtopic"
+                "topic_subtopic": (topic, subtopic),
+                "pdf_link": pdf_link.strip()
+            }
+
+        # Write the sidecar so the next launch can skip parsing entirely.
+        if src_mtime is not None:
+            try:
+                with open(_PICKLE_CACHE, "wb") as f:
+                    pickle.dump((_PICKLE_CACHE_VERSION, self.data), f, protocol=5)
+            except OSError as e:
+                print("Could not write cache", _PICKLE_CACHE + ":", e)
+
+        self._build_graph()
+
+    def _build_graph(self):
+        """Build the topic/subtopic/patent graph once, at load time.
+
+        show_mind_map used to rebuild this graph (and re-partition its
+        nodes by type) on every open; now it just reads these fields.
+        """
+        # add_node is idempotent (it merges attributes in place), so no
+        # has_node guards — a bare call does one node-dict lookup, not two.
+        G = nx.Graph()
+        for patent, info in self.data.items():
+            topic, subtopic = info["topic_subtopic"]
+            G.add_node(topic, type='topic')
+            G.add_node(patent, type='patent')
+            if subtopic:
+                G.add_node(subtopic, type='subtopic')
+                G.add_edge(topic, subtopic)
+                G.add_edge(subtopic, patent)
+            else:
+                G.add_edge(topic, patent)
+
+        self._graph = G
+        self._topic_nodes = [n for n, d in G.nodes(data=True) if d.get('type') == 'topic']
+        self._subtopic_nodes = [n for n, d in G.nodes(data=True) if d.get('type') == 'subtopic']
+        self._patent_nodes = [n for n, d in G.nodes(data=True) if d.get('type') == 'patent']
+        self._data_version += 1
+
+    def handle_search(self):
+        """When the user presses Enter in the search bar, load the corresponding PDF."""
+        query = self.search_bar.text().strip()
+        if query in self.data:
+            self.load_pdf_for_patent(query)
+        elif query:
+            # Not in the local dataset — fall back to Google Patents. The
+            # lookup blocks on the network for up to 5 s, so run it in a
+            # worker thread rather than freezing the GUI thread.
+            print("Patent not found locally, searching Google Patents:", query)
+            threading.Thread(
+                target=lambda: self._search_resolved.emit(
+                    GooglePatentSearcher.search_patents(query)),
+                daemon=True).start()
+
+    def _on_search_resolved(self, url):
+        self._queue_pdf_load(QUrl(url))
+
+    def load_pdf_for_patent(self, patent):
+        """Load the PDF for a known patent and sync the search bar."""
+        pdf_link = self.data[patent]["pdf_link"]
+        if pdf_link:
+            # Load the PDF link in the QWebEngineView.
+            self._queue_pdf_load(QUrl(pdf_link))
+            self.search_bar.setText(patent)
+        else:
+            print("No PDF link available for", patent)
+
+    def _queue_pdf_load(self, url):
+        """Schedule a debounced load; only the last URL within the window loads."""
+        self._pending_url = url
+        self._load_timer.start()
+
+    def _ensure_pdf_view(self):
+        """Create the QWebEngineView the first time a PDF is loaded."""
+        if self.pdf_view is None:
+            self.pdf_view = QWebEngineView()
+            self._central_layout.replaceWidget(self._pdf_placeholder, self.pdf_view)
+            self._pdf_placeholder.deleteLater()
+            self._pdf_placeholder = None
+
+    def _do_load(self):
+        self._ensure_pdf_view()
+        self.pdf_view.stop()  # cancel any in-flight load first
+        self.pdf_view.load(self._pending_url)
+
+    def show_tree_view(self):
+        """Show a dialog with a tree view of the patents organized by Topic and Subtopic."""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Patent Tree View")
+        dialog.resize(400, 500)
+
+        tree_view = QTreeView(dialog)
+        # Rebuild the model only when the data has changed since it was
+        # last built; repeat opens reuse the cached one.
+        if self._tree_model is None or self._tree_model_version != self._data_version:
+            self._tree_model = self._build_tree_model()
+            self._tree_model_version = self._data_version
+        model = self._tree_model
+
+        tree_view.setModel(model)
+        tree_view.expandAll()
+
+        # Optional: double-clicking a patent (leaf node) loads its PDF.
+        tree_view.doubleClicked.connect(lambda index: self.tree_item_double_clicked(index, model))
+
+        dlg_layout = QVBoxLayout(dialog)
+        dlg_layout.addWidget(tree_view)
+        dialog.setLayout(dlg_layout)
+
+        dialog.exec_()
+
+    def _build_tree_model(self):
+        """Build the Topic/Subtopic/patent QStandardItemModel."""
+        model = QStandardItemModel(self)
+        model.setHorizontalHeaderLabels(["Patent Organization"])
+
+        # Build a nested dictionary: topics → subtopics → list of patents.
+        topics = {}
+        for patent, info in self.data.items():
+            topic, subtopic = info["topic_subtopic"]
+            topics.setdefault(topic, {})
+            if subtopic:
+                topics[topic].setdefault(subtopic, []).append(patent)
+            else:
+                topics[topic].setdefault("", []).append(patent)
+
+        # Populate the QStandardItemModel with the tree data.
+        for topic, subtopics in topics.items():
+            topic_item = QStandardItem(topic)
+            for subtopic, patents in subtopics.items():
+                # appendRows inserts the whole batch with one round of
+                # insertion bookkeeping instead of one per patent.
+                rows = [QStandardItem(patent) for patent in patents]
+                if subtopic:
+                    subtopic_item = QStandardItem(subtopic)
+                    subtopic_item.appendRows(rows)
+                    topic_item.appendRow(subtopic_item)
+                else:
+                    # If no subtopic is provided, add the patents directly under the topic.
+                    topic_item.appendRows(rows)
+            model.appendRow(topic_item)
+
+        return model
+
+    def tree_item_double_clicked(self, index, model):
+        """If a leaf item (patent) is double-clicked in the tree, load its PDF."""
+        item = model.itemFromIndex(index)
+        if item and not item.hasChildren():  # leaf item assumed to be a patent
+            patent = item.text()
+            if patent in self.data:
+                self.load_pdf_for_patent(patent)
+            else:
+                print("Patent not found:", patent)
+
+    def _layout_positions(self, G):
+        """Return layout positions for G, memoized in memory and on disk.
+
+        The cache key is a hash of the sorted edge list, so reopening the
+        mind map (or relaunching the app) with unchanged data skips the
+        layout computation entirely.
+        """
+        key = hashlib.blake2b(repr(sorted(G.edges())).encode()).hexdigest()
+        pos = self._layout_cache.get(key)
+        if pos is not None:
+            return pos
+
+        cache_file = os.path.join(_LAYOUT_CACHE_DIR, key + ".npz")
+        if os.path.exists(cache_file):
+            try:
+                with np.load(cache_file) as npz:
+                    pos = dict(zip(npz["nodes"].tolist(), npz["coords"]))
+                self._layout_cache[key] = pos
+                return pos
+            except Exception as e:
+                print("Ignoring unreadable cache", cache_file + ":", e)
+
+        pos = compute_layout(G, iterations=50)
+        self._layout_cache[key] = pos
+        try:
+            os.makedirs(_LAYOUT_CACHE_DIR, exist_ok=True)
+            np.savez(cache_file,
+                     nodes=np.array(list(pos.keys())),
+                     coords=np.array(list(pos.values()), dtype=np.float32))
+        except OSError as e:
+            print("Could not write cache", cache_file + ":", e)
+        return pos
+
+    def show_mind_map(self):
+        """Show a dialog with a mind map of topics, subtopics and patents."""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Patent Mind Map")
+        dialog.resize(800, 600)
+
+        # The graph is built once in load_data; reuse it here.
+        G = self._graph
+
+        # With no data loaded (e.g. data.json missing) there is nothing to
+        # lay out — and the layout/render backends all choke on an empty
+        # graph — so degrade to an empty dialog like the tree view does.
+        if G.number_of_nodes() == 0:
+            dlg_layout = QVBoxLayout(dialog)
+            placeholder = QLabel("No patent data loaded.")
+            placeholder.setAlignment(Qt.AlignCenter)
+            dlg_layout.addWidget(placeholder)
+            dialog.setLayout(dlg_layout)
+            dialog.exec_()
+            return
+
+        pos = self._layout_positions(G)
+
+        # Struct-of-arrays copy of the layout: one N×2 float32 array plus a
+        # parallel name list, so click hit-testing is a single vector op
+        # instead of a Python loop over the pos dict.
+        self._pos_names = list(G.nodes())
+        self._pos_xy = np.fromiter(
+            (c for n in self._pos_names for c in pos[n]),
+            dtype=np.float32, count=2 * len(self._pos_names)).reshape(-1, 2)
+        # KD-tree makes each click O(log N) instead of an O(N) argmin;
+        # worthwhile from a few thousand nodes up.
+        self._kdtree = cKDTree(self._pos_xy) if cKDTree is not None else None
+
+        if pg is not None:
+            widget = self._mind_map_widget_pg(dialog)
+        else:
+            widget = self._mind_map_canvas_mpl(dialog, pos)
+
+        dlg_layout = QVBoxLayout(dialog)
+        dlg_layout.addWidget(widget)
+        dialog.setLayout(dlg_layout)
+
+        dialog.exec_()
+
+    def _mind_map_widget_pg(self, dialog):
+        """Qt-native mind map: hardware-accelerated scatter via pyqtgraph.
+
+        Hit-testing happens in pyqtgraph's own scatter item, so clicks
+        don't need the NumPy nearest-node search at all.
+        """
+        G = self._graph
+        index = {n: i for i, n in enumerate(self._pos_names)}
+        adj = np.array([[index[u], index[v]] for u, v in G.edges()])
+        types = np.array([G.nodes[n]['type'] for n in self._pos_names])
+        sizes = np.where(types == 'topic', 30,
+                         np.where(types == 'subtopic', 24, 18))
+        brushes = [pg.mkBrush(c) for c in
+                   np.where(types == 'topic', 'lightblue',
+                            np.where(types == 'subtopic', 'lightgreen', 'lightcoral'))]
+
+        widget = pg.GraphicsLayoutWidget(dialog)
+        viewbox = widget.addViewBox()
+        viewbox.setAspectLocked()
+        graph_item = pg.GraphItem()
+        viewbox.addItem(graph_item)
+        graph_item.setData(pos=self._pos_xy, adj=adj, size=sizes,
+                           symbolBrush=brushes, pxMode=True,
+                           data=np.arange(len(self._pos_names)))
+
+        # Same labelling policy as the matplotlib path: static labels for
+        # the few topic/subtopic nodes only.
+        for n in self._topic_nodes + self._subtopic_nodes:
+            label = pg.TextItem(n, anchor=(0.5, 0.5))
+            label.setPos(*self._pos_xy[index[n]])
+            viewbox.addItem(label)
+
+        def on_scatter_clicked(_, points, *args):
+            if not points:
+                return
+            node = self._pos_names[int(points[0].data())]
+            if node in self.data:
+                self.load_pdf_for_patent(node)
+                dialog.accept()
+
+        graph_item.scatter.sigClicked.connect(on_scatter_clicked)
+        return widget
+
+    def _mind_map_canvas_mpl(self, dialog, pos):
+        """Matplotlib mind map, used when pyqtgraph is not installed."""
+        G = self._graph
+
+        figure = Figure(figsize=(8, 6))
+        canvas = FigureCanvas(figure)
+        ax = figure.add_subplot(111)
+
+        # Draw all nodes as one scatter artist instead of three
+        # draw_networkx_nodes calls, and rasterize the edge collection;
+        # the artist count drops from 3N+E to two collections (plus labels).
+        types = np.array([G.nodes[n]['type'] for n in self._pos_names])
+        colors = np.where(types == 'topic', 'lightblue',
+                          np.where(types == 'subtopic', 'lightgreen', 'lightcoral'))
+        sizes = np.where(types == 'topic', 600,
+                         np.where(types == 'subtopic', 400, 300))
+        scatter = ax.scatter(self._pos_xy[:, 0], self._pos_xy[:, 1],
+                             s=sizes, c=colors, zorder=2)
+        edges = nx.draw_networkx_edges(G, pos, ax=ax)
+        edges.set_rasterized(True)
+        # Per-node Text artists dominate render time on big maps (FreeType
+        # shapes every label), so only the handful of topic/subtopic nodes
+        # get static labels; patent names show up on hover instead. The
+        # subgraph is a view and labels=None lets networkx derive the label
+        # set itself, so no identity dict is allocated here.
+        nx.draw_networkx_labels(
+            G.subgraph(self._topic_nodes + self._subtopic_nodes),
+            pos, font_size=8, ax=ax)
+        if mplcursors is not None:
+            cursor = mplcursors.cursor(scatter, hover=True)
+            cursor.connect(
+                "add",
+                lambda sel: sel.annotation.set_text(self._pos_names[sel.index]))
+        ax.set_axis_off()
+
+        def on_click(event):
+            if event.xdata is None or event.ydata is None:
+                return
+            click = np.array([event.xdata, event.ydata], dtype=np.float32)
+            if self._kdtree is not None:
+                dist, idx = self._kdtree.query(click, k=1)
+                idx = int(idx)
+                hit = dist < 0.1
+            else:
+                diff = self._pos_xy - click
+                d2 = np.einsum('ij,ij->i', diff, diff)
+                idx = int(d2.argmin())
+                # Squared distance against the squared threshold (0.1**2);
+                # no sqrt needed.
+                hit = d2[idx] < 0.01
+            # Only index on a hit: an empty tree's query returns
+            # (inf, len(points)), which is out of range for _pos_names.
+            if hit:
+                closest_node = self._pos_names[idx]
+                if closest_node in self.data:
+                    self.load_pdf_for_patent(closest_node)
+                    dialog.accept()
+
+        canvas.mpl_connect('button_press_event', on_click)
+        return canvas
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.resize(800, 600)
+    window.show()
+    sys.exit(app.exec_())